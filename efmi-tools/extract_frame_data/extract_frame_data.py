@@ -357,15 +357,19 @@ def extract_frame_data(cfg, extract_lods=False):
 
         lods_count = 0
         vg_maps_count = 0
-    
+
+        # Dict views over the match table are built per access, hoist them out of the loop
+        matched = lod_matcher.matched
+        vg_maps = lod_matcher.vg_maps
+
         for component_id, component in enumerate(extracted_object.components):
 
-            (lod_name, lod_vb0_hash, lod_ib_hash, similarity) = lod_matcher.matched.get(component.vb0_hash, (None, None, None, None))
+            (lod_name, lod_vb0_hash, lod_ib_hash, similarity) = matched.get(component.vb0_hash, (None, None, None, None))
 
             if lod_vb0_hash is None:
                 continue
 
-            (vg_map_lod_vb0_hash, vg_map) = lod_matcher.vg_maps.get(component.vb0_hash, (None, None))
+            (vg_map_lod_vb0_hash, vg_map) = vg_maps.get(component.vb0_hash, (None, None))
 
             if component.vb0_hash == lod_vb0_hash and vg_map is None:
                 continue
@@ -1,16 +1,207 @@
+import heapq
 import json
+import logging
+import os
 import time
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from operator import itemgetter
-from typing import Optional, Dict, Tuple
-from dataclasses import dataclass
+from typing import Optional, Dict, List, Set, Tuple
+from dataclasses import dataclass, field
+
+import numpy
 
 from ..migoto_io.data_model.byte_buffer import MigotoFormat
 from ..migoto_io.data_model.numpy_mesh import NumpyMesh, GeometryMatcher, VertexGroupsMatcher
 
 from .output_builder import ObjectData
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+log = logging.getLogger(__name__)
+
+
+def _match_vgs_one(full_name, full_hash, lod_name, lod_hash, candidates_count, full_meshes, lod_meshes):
+    """Matches vertex groups for one already-selected LoD pair (runs in a worker thread)."""
+    t_vg = time.time()
+
+    vg_matcher = VertexGroupsMatcher(candidates_count=candidates_count)
+    vg_map = vg_matcher.match_vertex_groups(full_meshes[full_name], lod_meshes[lod_name])
+
+    return full_hash, lod_hash, vg_map, time.time() - t_vg
+
+
+def _match_one(full_name, full_hash, candidate_hashes, geo_params, full_meshes, lod_hash_to_mesh):
+    """Scores a single full component against LoD candidates (runs in a worker thread).
+
+    Prefilters all candidates with coarse settings, then recalculates the survivors
+    with fine settings. Uses a local GeometryMatcher so concurrent workers don't
+    clobber each other's samples_count/voxel_size.
+
+    Returns (full_name, full_hash, similarities, t_geo) where similarities maps
+    lod_hash to similarity for the refine-stage candidates, sorted best-first.
+    """
+    t_geo = time.time()
+
+    full_mesh = full_meshes[full_name]
+
+    geo_matcher = GeometryMatcher(method=geo_params.method, sensivity=geo_params.sensivity)
+
+    def calculate_similarities(candidates: List[Tuple[str, NumpyMesh]]):
+
+        similarities = {}
+
+        if geo_matcher.method == 'VOXEL':
+            # Sample the full mesh once per parameter regime and score all
+            # precomputed candidate point sets in a single batched call
+            full_samples = geo_matcher.precompute_samples(full_mesh)
+            lod_hashes = [lod_hash for lod_hash, _ in candidates]
+            lod_samples_list = [geo_matcher.precompute_samples(lod_mesh) for _, lod_mesh in candidates]
+            scores = geo_matcher.calculate_similarities_voxel_batch(full_samples, lod_samples_list)
+            similarities = dict(zip(lod_hashes, scores.tolist()))
+        else:
+            for lod_hash, lod_mesh in candidates:
+                # if lod_mesh is None:
+                #     continue
+                similarity = geo_matcher.calculate_similarity(
+                    full_mesh, lod_mesh
+                )
+                similarities[lod_hash] = similarity
+
+        return similarities
+
+    # Resolve candidate meshes once, scoring operates on flat (hash, mesh) tuples
+    candidates = [(lod_hash, lod_hash_to_mesh[lod_hash]) for lod_hash in candidate_hashes]
+
+    # Prefilter all candidates with coarse settings, unless they all fit into
+    # the candidate budget anyway and the coarse pass would be pure waste
+
+    if len(candidates) <= geo_params.prefilter_candidates_count:
+        prefiltered_candidates = candidates
+    else:
+        geo_matcher.samples_count = geo_params.prefilter_sample_size
+        geo_matcher.voxel_size = geo_params.prefilter_voxel_size
+
+        if geo_params.prefilter_signature and geo_matcher.method == 'VOXEL':
+            # Rank-only coarse pass: popcount Jaccard over packed occupancy
+            # bitsets, much cheaper than chamfer math but sensitive to sub-voxel
+            # shifts, hence opt-in
+            full_signature = geo_matcher.precompute_signature(full_mesh)
+            prefiltered_similarities = {
+                lod_hash: geo_matcher.calculate_similarity_signature(full_signature, geo_matcher.precompute_signature(lod_mesh))
+                for lod_hash, lod_mesh in candidates
+            }
+        else:
+            prefiltered_similarities = calculate_similarities(candidates)
+
+        # O(N log k) top-k extraction instead of sorting all N candidates
+        candidate_meshes = dict(candidates)
+        prefiltered_candidates = [
+            (lod_hash, candidate_meshes[lod_hash]) for lod_hash, _ in heapq.nlargest(
+                geo_params.prefilter_candidates_count, prefiltered_similarities.items(), key=itemgetter(1)
+            )
+        ]
+
+    # Refine surviving candidates with fine settings
+
+    geo_matcher.samples_count = geo_params.sample_size
+    geo_matcher.voxel_size = geo_params.voxel_size
+
+    similarities = calculate_similarities(prefiltered_candidates)
+
+    # Collation consumes a best-first ranking, and the survivor set is only k-sized
+    similarities = dict(sorted(similarities.items(), key=itemgetter(1), reverse=True))
+
+    return full_name, full_hash, similarities, time.time() - t_geo
+
+
+@dataclass
+class GeoMatcherParams:
+    method: str
+    sensivity: float
+    voxel_size: float
+    sample_size: int
+    prefilter_voxel_size: float
+    prefilter_sample_size: int
+    prefilter_candidates_count: int
+    prefilter_signature: bool = False
+
+
+# Row layout of the finalized match table; hashes are 8-char hex strings,
+# names are capped at 64 chars to match Blender object name limits
+MATCH_DTYPE = numpy.dtype([
+    ('full_hash', 'U16'),
+    ('lod_name', 'U64'),
+    ('lod_hash', 'U16'),
+    ('lod_ib_hash', 'U16'),
+    ('similarity', 'f4'),
+])
+
+
+@dataclass
+class MatchTable:
+    """Struct-of-arrays storage for match results.
+
+    Rows are appended as plain list entries during matching and packed into
+    NumPy arrays by finalize() once the table is complete.
+    """
+    full_hashes: List[str] = field(default_factory=list)
+    lod_names: List[str] = field(default_factory=list)
+    lod_hashes: List[str] = field(default_factory=list)
+    lod_ib_hashes: List[str] = field(default_factory=list)
+    similarities: List[float] = field(default_factory=list)
+
+    def __post_init__(self):
+        self._full_hash_set = set(self.full_hashes)
+
+    def __contains__(self, full_hash: str) -> bool:
+        return full_hash in self._full_hash_set
+
+    def __len__(self) -> int:
+        return len(self.full_hashes)
+
+    def append(self, full_hash: str, lod_name: str, lod_hash: str, lod_ib_hash: str, similarity: float):
+        self.full_hashes.append(full_hash)
+        self.lod_names.append(lod_name)
+        self.lod_hashes.append(lod_hash)
+        self.lod_ib_hashes.append(lod_ib_hash)
+        self.similarities.append(similarity)
+        self._full_hash_set.add(full_hash)
+
+    def finalize(self) -> 'MatchTable':
+        self.full_hashes = numpy.asarray(self.full_hashes)
+        self.lod_names = numpy.asarray(self.lod_names)
+        self.lod_hashes = numpy.asarray(self.lod_hashes)
+        self.lod_ib_hashes = numpy.asarray(self.lod_ib_hashes)
+        self.similarities = numpy.asarray(self.similarities, dtype=numpy.float64)
+        return self
+
+    def as_records(self) -> numpy.ndarray:
+        """Packs the table into a MATCH_DTYPE structured array.
+
+        Downstream reporting (mean similarity, worst match, histograms) runs
+        vectorized over the named columns instead of looping over tuples.
+        """
+        records = numpy.empty(len(self), dtype=MATCH_DTYPE)
+        records['full_hash'] = self.full_hashes
+        records['lod_name'] = self.lod_names
+        records['lod_hash'] = self.lod_hashes
+        records['lod_ib_hash'] = self.lod_ib_hashes
+        records['similarity'] = self.similarities
+        return records
+
+    def as_dict(self) -> Dict[str, Tuple[str, str, str, float]]:
+        return {
+            full_hash: (lod_name, lod_hash, lod_ib_hash, similarity)
+            for full_hash, lod_name, lod_hash, lod_ib_hash, similarity in zip(
+                self.full_hashes, self.lod_names, self.lod_hashes, self.lod_ib_hashes, self.similarities
+            )
+        }
+
 
 @dataclass
 class LODMatcher:
@@ -30,6 +221,14 @@ class LODMatcher:
     lod_model_path: Optional[Path] = None
     lod_objects: Optional[Dict[str, ObjectData]] = None
 
+    # Hash-exact matches are guaranteed near-identical, so their similarity is
+    # only worth computing when explicitly requested for logging
+    verbose_hash_similarity: bool = False
+
+    # Rank prefilter candidates by bitset-signature Jaccard instead of chamfer
+    # distance; faster but less tolerant to LoD decimation shifts
+    geo_matcher_prefilter_signature: bool = False
+
     def __post_init__(self):
         self.geo_matcher = GeometryMatcher(method=self.geo_matcher_method, sensivity=self.geo_matcher_sensivity)
         self.vg_matcher = VertexGroupsMatcher(candidates_count=self.vg_matcher_candidates_count)
@@ -37,14 +236,37 @@ class LODMatcher:
         self.full_components: Dict[str, Tuple[str, str]] = {}
         self.lod_components: Dict[str, Tuple[str, str]] = {}
 
+        # Immutable hash->(name, ib_hash) snapshot built by load_metadata; matched
+        # candidates are tracked in _consumed_lod_hashes instead of being popped,
+        # so worker jobs can share the snapshot without mutation hazards
         self.lod_hash_to_name: Dict[str, Tuple[str, str]] = {}
+        self._consumed_lod_hashes: Set[str] = set()
 
         self.full_meshes: Dict[str, NumpyMesh] = {}
         self.lod_meshes: Dict[str, NumpyMesh] = {}
 
-        self.matched: Dict[str, Tuple[str, str, str, float]] = {}
+        # Direct hash->mesh view over lod_meshes, skips the hash->name->mesh
+        # double lookup on the scoring path
+        self._lod_hash_to_mesh: Dict[str, NumpyMesh] = {}
 
-        self.vg_maps: Dict[str, Tuple[str, Dict[int, int]]] = {}
+        self.match_table = MatchTable()
+
+        # MATCH_DTYPE structured array built by run(), see matched for the dict view
+        self.matched_array: Optional[numpy.ndarray] = None
+
+        # Packed (src, dst) VG id pairs per full hash, see vg_maps for the dict view
+        self._vg_map_pairs: Dict[str, Tuple[str, numpy.ndarray]] = {}
+
+    @property
+    def matched(self) -> Dict[str, Tuple[str, str, str, float]]:
+        return self.match_table.as_dict()
+
+    @property
+    def vg_maps(self) -> Dict[str, Tuple[str, Dict[int, int]]]:
+        return {
+            full_hash: (lod_hash, {int(src): int(dst) for src, dst in pairs})
+            for full_hash, (lod_hash, pairs) in self._vg_map_pairs.items()
+        }
 
     # -------------------------
     # Loading
@@ -52,18 +274,16 @@ class LODMatcher:
 
     def _load_component_hashes(self, path: Optional[Path] = None, json_str: str = '', object_id: str = '') -> Dict[str, Tuple[str, str]]:
         if path is not None:
-            with open(path / 'Metadata.json', 'r') as f:
-                metadata = json.load(f)
-            return {
-                f'Component {i}': (component['vb0_hash'], component['ib_hash'])
-                for i, component in enumerate(metadata['components'])
-            }
+            raw_metadata = (path / 'Metadata.json').read_bytes()
+            prefix = 'Component'
         else:
-            metadata = json.loads(json_str)
-            return {
-                f'{object_id} - Component {i}': (component['vb0_hash'], component['ib_hash'])
-                for i, component in enumerate(metadata['components'])
-            }
+            raw_metadata = json_str
+            prefix = f'{object_id} - Component'
+        metadata = orjson.loads(raw_metadata) if orjson is not None else json.loads(raw_metadata)
+        return {
+            f'{prefix} {i}': (component['vb0_hash'], component['ib_hash'])
+            for i, component in enumerate(metadata['components'])
+        }
 
     def load_metadata(self):
         self.full_components = self._load_component_hashes(self.full_model_path)
@@ -77,40 +297,70 @@ class LODMatcher:
     def load_meshes(self):
         t0 = time.time()
 
-        self.full_meshes = {
-            name: NumpyMesh.from_paths(vb_path=self.full_model_path / f'{name}.vb')
-            for name in self.full_components
-        }
+        # File reads and buffer parsing release the GIL, so meshes load concurrently
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
 
-        if self.lod_model_path is not None:
-            self.lod_meshes = {
-                name: NumpyMesh.from_paths(vb_path=self.lod_model_path / f'{name}.vb')
-                for name in self.lod_components
+            # Join paths as pre-hoisted strings to skip the / operator's
+            # per-iteration argument parsing and normalization
+            full_dir = str(self.full_model_path)
+
+            full_futures = {
+                name: executor.submit(NumpyMesh.from_paths, vb_path=Path(os.path.join(full_dir, f'{name}.vb')))
+                for name in self.full_components
             }
 
-        if self.lod_objects is not None:
-            for object_id, obj_data in self.lod_objects.items():
-                for component_id, component in enumerate(obj_data.components):
-                    try:
-                        fmt = MigotoFormat.from_fmt_text(component.fmt)
-                        mesh = NumpyMesh.from_bytes(migoto_format=fmt, vb_bytes=component.vb, ib_bytes=component.ib)
-                        self.lod_meshes[f'{object_id} - Component {component_id}'] = mesh
-                    except Exception as e:
-                        print(f'Failed to load mesh `{object_id} - Component {component_id}`: {component.ib_source.data.path}')
-                        self.lod_meshes[f'{object_id} - Component {component_id}'] = None
+            lod_futures = {}
+            if self.lod_model_path is not None:
+                lod_dir = str(self.lod_model_path)
+                lod_futures = {
+                    name: executor.submit(NumpyMesh.from_paths, vb_path=Path(os.path.join(lod_dir, f'{name}.vb')))
+                    for name in self.lod_components
+                }
+
+            if self.lod_objects is not None:
+                for object_id, obj_data in self.lod_objects.items():
+                    for component_id, component in enumerate(obj_data.components):
+                        name = f'{object_id} - Component {component_id}'
+                        lod_futures[name] = executor.submit(self._load_mesh_from_bytes, name, component)
+
+            self.full_meshes = {name: future.result() for name, future in full_futures.items()}
+            self.lod_meshes = {name: future.result() for name, future in lod_futures.items()}
+
+        self._lod_hash_to_mesh = {
+            vb0_hash: self.lod_meshes[name]
+            for name, (vb0_hash, ib_hash) in self.lod_components.items()
+            if name in self.lod_meshes
+        }
+
+        log.info(f'Models data load time: {time.time() - t0:.03f}s')
 
-        print(f'Models data load time: {time.time() - t0:.03f}s')
+    @staticmethod
+    def _load_mesh_from_bytes(name, component) -> Optional[NumpyMesh]:
+        try:
+            fmt = MigotoFormat.from_fmt_text(component.fmt)
+            return NumpyMesh.from_bytes(migoto_format=fmt, vb_bytes=component.vb, ib_bytes=component.ib)
+        except Exception as e:
+            log.warning(f'Failed to load mesh `{name}`: {component.ib_source.data.path}')
+            return None
 
     # -------------------------
     # Matching
     # -------------------------
 
+    @property
+    def _remaining_lod_count(self) -> int:
+        return len(self.lod_hash_to_name) - len(self._consumed_lod_hashes)
+
     def match_by_hash(self):
         for full_name, (full_hash, full_ib_hash) in self.full_components.items():
-            lod_info = self.lod_hash_to_name.pop(full_hash, None)
+            if full_hash in self._consumed_lod_hashes:
+                continue
+            lod_info = self.lod_hash_to_name.get(full_hash, None)
             if lod_info is None:
                 continue
 
+            self._consumed_lod_hashes.add(full_hash)
+
             lod_name, lod_ib_hash = lod_info
 
             if self.lod_meshes[lod_name] is None:
@@ -121,128 +371,215 @@ class LODMatcher:
                 self.lod_meshes[lod_name],
             )
 
-            self.matched[full_hash] = (lod_name, full_hash, lod_ib_hash, similarity)
-
-            print(
-                f'{full_name} {full_hash} = {lod_name} {full_hash} '
-                f'(by hash from {len(self.lod_hash_to_name)} candidates) '
-                f'similarity={similarity:.2f}'
-            )
-
-    def match_by_geometry(self):
-        
-        def calculate_similarities(lod_hash_to_names):
-
-            similarities = {}
+            self.match_table.append(full_hash, lod_name, full_hash, lod_ib_hash, similarity)
 
-            for lod_hash, lod_name in lod_hash_to_names.items():
-                # if self.lod_meshes[lod_name] is None:
-                #     continue
-                similarity = self.geo_matcher.calculate_similarity(
-                    full_mesh, self.lod_meshes[lod_name]
+            if log.isEnabledFor(logging.INFO):
+                log.info(
+                    f'{full_name} {full_hash} = {lod_name} {full_hash} '
+                    f'(by hash from {self._remaining_lod_count} candidates) '
+                    f'similarity={similarity:.2f}'
                 )
-                similarities[lod_hash] = similarity
 
-            similarities = dict(
-                sorted(similarities.items(), key=itemgetter(1), reverse=True)
-            )
+    def match_by_geometry(self):
+        pairs = self._select_lod_matches()
+        self._build_vg_maps(pairs)
+
+        # Flush per-run caches so sampled representations don't outlive matching
+        self.geo_matcher.clear_cache(list(self.full_meshes.values()) + list(self.lod_meshes.values()))
+
+    def _select_lod_matches(self) -> List[Tuple[str, str, str, str]]:
+        """Assigns the best LoD to every full component, geometry phase only.
+
+        Returns the selected (full_name, full_hash, lod_name, lod_hash) pairs
+        for the subsequent vertex-group matching phase.
+        """
+        geo_params = GeoMatcherParams(
+            method=self.geo_matcher_method,
+            sensivity=self.geo_matcher_sensivity,
+            voxel_size=self.geo_matcher_voxel_size,
+            sample_size=self.geo_matcher_sample_size,
+            prefilter_voxel_size=self.geo_matcher_prefilter_voxel_size,
+            prefilter_sample_size=self.geo_matcher_prefilter_sample_size,
+            prefilter_candidates_count=self.geo_matcher_prefilter_candidates_count,
+            prefilter_signature=self.geo_matcher_prefilter_signature,
+        )
+
+        pairs: List[Tuple[str, str, str, str]] = []
+        pending: List[Tuple[str, str]] = []
+
+        # Strip exact-hash matches first, so remaining candidates are independent
+        # and per-component geometry jobs can run in parallel
+
+        # Geometry matches are only recorded after collation, so duplicates
+        # between pending components must be caught here, not via match_table
+        seen_hashes: Set[str] = set()
 
-            return similarities
-        
         for full_name, (full_hash, full_ib_hash) in self.full_components.items():
 
-            if full_hash in self.matched:
+            if full_hash in seen_hashes or full_hash in self.match_table:
                 raise ValueError(f'Duplicate component vb0 hash {full_hash} found in Metadata.json!')
+            seen_hashes.add(full_hash)
 
-            full_mesh = self.full_meshes[full_name]
-            
-            best_lod_hash, best_lod_ib_hash, best_similarity = None, None, None
+            lod_info = self.lod_hash_to_name.get(full_hash, None)
 
-            # Try to get LoD by full model hash
+            if lod_info is None or full_hash in self._consumed_lod_hashes:
+                pending.append((full_name, full_hash))
+                continue
 
-            lod_info = self.lod_hash_to_name.pop(full_hash, None)
+            self._consumed_lod_hashes.add(full_hash)
 
-            if lod_info is not None:
-                best_lod_name, best_lod_ib_hash = lod_info
+            best_lod_name, best_lod_ib_hash = lod_info
 
+            if self.verbose_hash_similarity:
                 similarity = self.geo_matcher.calculate_similarity(
                     self.full_meshes[full_name],
                     self.lod_meshes[best_lod_name],
                 )
+                similarity_text = f'{similarity:.2f}'
+            else:
+                # Identical vb0 hash means identical geometry, skip the expensive check
+                similarity = 100.0
+                similarity_text = 'hash-exact'
 
-                print(
+            if log.isEnabledFor(logging.INFO):
+                log.info(
                     f'{full_name} {full_hash} = {best_lod_name} {full_hash} '
-                    f'(by hash from {len(self.lod_hash_to_name)} candidates) '
-                    f'similarity={similarity:.2f}'
+                    f'(by hash from {self._remaining_lod_count} candidates) '
+                    f'similarity={similarity_text}'
                 )
-                
-                best_similarity = similarity
-                best_lod_hash = full_hash
-                t_geo = 0
 
-            else:
+            pairs.append(self._record_match(full_name, full_hash, best_lod_name, full_hash, best_lod_ib_hash, similarity, t_geo=0))
+
+        if len(pending) > 0:
 
-                # Try to get LoD by geometry matching
+            # Match remaining components by geometry, one worker job per full component
 
-                t_geo = time.time()
+            candidate_hashes = self._available_candidate_hashes()
 
-                self.geo_matcher.samples_count = self.geo_matcher_prefilter_sample_size
-                self.geo_matcher.voxel_size = self.geo_matcher_prefilter_voxel_size
+            workers_count = min(len(pending), os.cpu_count() or 1)
 
-                prefiltered_similarities = calculate_similarities({h: info[0] for h, info in self.lod_hash_to_name.items()})
+            if workers_count > 1:
+                # Threads, not processes: the hot path is NumPy which releases
+                # the GIL, and process pools don't survive Blender's embedded
+                # Python on Windows (spawn re-executes blender.exe and workers
+                # can't re-import the addon outside Blender's addon path setup)
+                with ThreadPoolExecutor(max_workers=workers_count) as executor:
+                    futures = [
+                        executor.submit(_match_one, full_name, full_hash, candidate_hashes, geo_params, self.full_meshes, self._lod_hash_to_mesh)
+                        for full_name, full_hash in pending
+                    ]
+                    # Collate in submission order, not completion order: when two
+                    # components contend for the same LoD the winner must be
+                    # decided by metadata order, so output is stable run-to-run
+                    for future in futures:
+                        pairs.append(self._collate_match(*future.result(), geo_params))
+            else:
+                for full_name, full_hash in pending:
+                    result = _match_one(full_name, full_hash, candidate_hashes, geo_params, self.full_meshes, self._lod_hash_to_mesh)
+                    pairs.append(self._collate_match(*result, geo_params))
 
-                prefiltered_lod_hashes = list(prefiltered_similarities.keys())[:min(self.geo_matcher_prefilter_candidates_count, len(prefiltered_similarities))]
+        return pairs
 
-                lod_hash_to_names = {hash: self.lod_hash_to_name[hash][0] for hash in prefiltered_lod_hashes}
-                
-                self.geo_matcher.samples_count = self.geo_matcher_sample_size
-                self.geo_matcher.voxel_size = self.geo_matcher_voxel_size
+    def _available_candidate_hashes(self) -> List[str]:
+        return [
+            lod_hash for lod_hash in self.lod_hash_to_name
+            if lod_hash not in self._consumed_lod_hashes
+        ]
 
-                similarities = calculate_similarities(lod_hash_to_names)
+    def _collate_match(self, full_name, full_hash, similarities, t_geo, geo_params):
+        """Consumes the best still-available LoD candidate for given similarities ranking."""
+        best_lod_hash, best_lod_info, best_similarity = None, None, None
 
-                t_geo = time.time() - t_geo
+        for lod_hash, similarity in similarities.items():
+            if lod_hash in self._consumed_lod_hashes:
+                continue
+            best_lod_hash, best_lod_info, best_similarity = lod_hash, self.lod_hash_to_name[lod_hash], similarity
+            break
+
+        if best_lod_info is None:
+            # All refine-stage candidates were consumed by concurrent jobs, rerun
+            # the match against the remaining candidates on the main thread
+            if self._remaining_lod_count == 0:
+                raise ValueError(f'No LoD candidates left to match {full_name} {full_hash}!')
+            _, _, similarities, t_retry = _match_one(full_name, full_hash, self._available_candidate_hashes(), geo_params, self.full_meshes, self._lod_hash_to_mesh)
+            t_geo += t_retry
+            best_lod_hash, best_similarity = next(iter(similarities.items()))
+            best_lod_info = self.lod_hash_to_name[best_lod_hash]
+
+        self._consumed_lod_hashes.add(best_lod_hash)
+
+        best_lod_name, best_lod_ib_hash = best_lod_info
+
+        if log.isEnabledFor(logging.INFO):
+            log.info(
+                f'{full_name} {full_hash} = {best_lod_name} {best_lod_hash} {len(self._lod_hash_to_mesh[best_lod_hash].vertex_buffer)}'
+                f'(by geo from {self._remaining_lod_count} candidates) '
+                f'similarity={best_similarity:.2f}%, '
+            )
 
-                best_lod_hash, best_similarity = next(iter(similarities.items()))
-                best_lod_info = self.lod_hash_to_name.pop(best_lod_hash)
-                best_lod_name, best_lod_ib_hash = best_lod_info
+        return self._record_match(full_name, full_hash, best_lod_name, best_lod_hash, best_lod_ib_hash, best_similarity, t_geo)
 
-                print(
-                    f'{full_name} {full_hash} = {best_lod_name} {best_lod_hash} {len(self.lod_meshes[best_lod_name].vertex_buffer)}'
-                    f'(by geo from {len(self.lod_hash_to_name)} candidates) '
-                    f'similarity={best_similarity:.2f}%, '
-                )
+    def _record_match(self, full_name, full_hash, best_lod_name, best_lod_hash, best_lod_ib_hash, best_similarity, t_geo) -> Tuple[str, str, str, str]:
+        self.match_table.append(full_hash, best_lod_name, best_lod_hash, best_lod_ib_hash, best_similarity)
 
-            self.matched[full_hash] = (best_lod_name, best_lod_hash, best_lod_ib_hash, best_similarity)
-                
-            # Match VGs
+        if log.isEnabledFor(logging.INFO):
+            log.info(f'    LoD meshes match time: {t_geo:.03f}s')
 
-            t_vg = time.time()
+        return full_name, full_hash, best_lod_name, best_lod_hash
 
-            vg_map = self.vg_matcher.match_vertex_groups(
-                full_mesh,
-                self.lod_meshes[best_lod_name],
-            )
+    def _build_vg_maps(self, pairs: List[Tuple[str, str, str, str]]):
+        """Matches vertex groups for all selected pairs, one worker job per pair."""
+        if len(pairs) == 0:
+            return
 
-            t_vg = time.time() - t_vg
+        workers_count = min(len(pairs), os.cpu_count() or 1)
 
-            # Save result
+        if workers_count > 1:
+            # Threads for the same reason as the geometry phase: Chamfer math is
+            # NumPy and releases the GIL, and process pools don't work inside
+            # Blender's embedded Python; meshes are shared, not re-pickled
+            with ThreadPoolExecutor(max_workers=workers_count) as executor:
+                futures = [
+                    executor.submit(_match_vgs_one, full_name, full_hash, lod_name, lod_hash, self.vg_matcher.candidates_count, self.full_meshes, self.lod_meshes)
+                    for full_name, full_hash, lod_name, lod_hash in pairs
+                ]
+                for future in futures:
+                    self._save_vg_map(*future.result())
+        else:
+            for full_name, full_hash, lod_name, lod_hash in pairs:
+                result = _match_vgs_one(full_name, full_hash, lod_name, lod_hash, self.vg_matcher.candidates_count, self.full_meshes, self.lod_meshes)
+                self._save_vg_map(*result)
 
-            remapped = sum(1 for k, v in vg_map.items() if k != v)
+    def _save_vg_map(self, full_hash, lod_hash, vg_map, t_vg):
+        # Pack the VG map as (src, dst) int32 pairs, far denser than a dict
+        vg_pairs = numpy.fromiter(
+            (vg_id for vg_pair in vg_map.items() for vg_id in vg_pair),
+            dtype=numpy.int32, count=2 * len(vg_map)
+        ).reshape(-1, 2)
 
+        remapped = int(numpy.count_nonzero(vg_pairs[:, 0] != vg_pairs[:, 1]))
+
+        if remapped > 0:
+            self._vg_map_pairs[full_hash] = (lod_hash, vg_pairs)
+
+        # Guard hot-loop log lines so disabled levels skip the f-string formatting
+        if log.isEnabledFor(logging.INFO):
             if remapped > 0:
-                self.vg_maps[full_hash] = (best_lod_hash, vg_map)
-                print(f'remapped VGs={remapped}/{len(vg_map) or 1}')
+                log.info(f'remapped VGs={remapped}/{len(vg_map) or 1}')
             else:
-                print(f'all {len(vg_map)} VGs matched (LoD uses full skeleton)')
-
-            print(f'    LoD meshes match time: {t_geo:.03f}s')
-            print(f'    Vertex Groups match time: {t_vg:.03f}s')
+                log.info(f'all {len(vg_map)} VGs matched (LoD uses full skeleton)')
+            log.info(f'    Vertex Groups match time: {t_vg:.03f}s')
 
     # -------------------------
     # Public API
     # -------------------------
 
-    def run(self) -> Dict[str, str]:
+    @staticmethod
+    def clear_mesh_cache():
+        """Evicts path-loaded meshes cached across LODMatcher runs."""
+        NumpyMesh.clear_mesh_cache()
+
+    def run(self) -> Dict[str, Tuple[str, str, str, float]]:
         t0 = time.time()
 
         self.load_metadata()
@@ -251,5 +588,11 @@ class LODMatcher:
         # self.match_by_hash()
         self.match_by_geometry()
 
-        print(f'Total processing time: {time.time() - t0:.03f}s')
+        self.matched_array = self.match_table.finalize().as_records()
+
+        if len(self.matched_array) > 0 and log.isEnabledFor(logging.INFO):
+            similarities = self.matched_array['similarity']
+            log.info(f'Matched {len(self.matched_array)} components '
+                     f'(similarity min {similarities.min():.2f}%, mean {similarities.mean():.2f}%)')
+        log.info(f'Total processing time: {time.time() - t0:.03f}s')
         return self.matched
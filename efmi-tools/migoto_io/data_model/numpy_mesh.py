@@ -1,6 +1,9 @@
+import os
+
 import numpy
 
-from typing import Union, List, Optional, Dict, Iterable
+from collections import OrderedDict
+from typing import Union, List, Optional, Dict, Iterable, ClassVar
 from dataclasses import dataclass, fields
 from enum import Enum
 from pathlib import Path
@@ -9,12 +12,31 @@ from .dxgi_format import *
 from .byte_buffer import MigotoFormat, NumpyBuffer, AbstractSemantic, Semantic
 
 
+if hasattr(numpy, 'bitwise_count'):
+    def _popcount(bitset: numpy.ndarray) -> int:
+        return int(numpy.bitwise_count(bitset).sum())
+else:
+    # numpy < 2.0 has no popcount ufunc
+    def _popcount(bitset: numpy.ndarray) -> int:
+        return int(numpy.unpackbits(bitset.view(numpy.uint8)).sum())
+
+
 @dataclass
 class NumpyMesh:
     format: Optional[MigotoFormat] = None
     index_buffer: Optional[NumpyBuffer] = None
     vertex_buffer: Optional[NumpyBuffer] = None
 
+    # LRU of path-loaded meshes keyed by (path, mtime_ns) pairs, so repeat loads
+    # of the same files (batch runs, re-matching) skip I/O and parsing; meshes
+    # are treated as immutable after loading
+    _path_cache: ClassVar['OrderedDict'] = OrderedDict()
+    _path_cache_maxsize: ClassVar[int] = 512
+
+    def __post_init__(self):
+        # Sampled representations keyed by sampling parameters, see GeometryMatcher
+        self._voxel_cache = {}
+
     def get_data(self, semantic: Union[AbstractSemantic, Semantic]):
         if isinstance(semantic, Semantic):
             semantic = AbstractSemantic(semantic)
@@ -33,9 +55,29 @@ class NumpyMesh:
         ib_path: Optional[Path] = None,
         fmt_path: Optional[Path] = None
     ) -> 'NumpyMesh':
-        
-        # Make migoto format from fmt file
+
+        # Repeat loads of unchanged files are served from the cache; explicit
+        # migoto_format objects bypass it since they aren't part of the key
+        cache_key = None
         if migoto_format is None:
+            # Resolve partner files up front so the key covers every file the
+            # loader actually reads - a regenerated .ib or .fmt must invalidate
+            # the cached mesh even when the .vb is untouched
+            if vb_path is None:
+                vb_path = cls.resolve_partner_path(ib_path, '.vb')
+            if ib_path is None:
+                ib_path = cls.resolve_partner_path(vb_path, '.ib')
+            if fmt_path is None:
+                fmt_path = cls.resolve_partner_path(vb_path or ib_path, '.fmt')
+
+            cache_key = cls._mesh_cache_key(vb_path, ib_path, fmt_path)
+            if cache_key is not None:
+                cached_mesh = cls._path_cache.get(cache_key, None)
+                if cached_mesh is not None:
+                    cls._path_cache.move_to_end(cache_key)
+                    return cached_mesh
+
+            # Make migoto format from fmt file
             migoto_format = MigotoFormat.from_paths(fmt_path, vb_path, ib_path)
 
         vb_bytes = None
@@ -52,7 +94,32 @@ class NumpyMesh:
             with open(ib_path, 'rb') as ib:
                 ib_bytes = ib.read()
 
-        return cls.from_bytes(migoto_format, vb_bytes, ib_bytes)
+        mesh = cls.from_bytes(migoto_format, vb_bytes, ib_bytes)
+
+        if cache_key is not None:
+            cls._path_cache[cache_key] = mesh
+            while len(cls._path_cache) > cls._path_cache_maxsize:
+                cls._path_cache.popitem(last=False)
+
+        return mesh
+
+    @staticmethod
+    def _mesh_cache_key(*paths: Optional[Path]) -> Optional[tuple]:
+        """Builds a cache key of (path, mtime_ns) pairs, None if any path is unstatable."""
+        key = []
+        for path in paths:
+            if path is None:
+                key.append(None)
+                continue
+            try:
+                key.append((os.fspath(path), os.stat(path).st_mtime_ns))
+            except OSError:
+                return None
+        return tuple(key)
+
+    @classmethod
+    def clear_mesh_cache(cls):
+        cls._path_cache.clear()
 
     @staticmethod
     def resolve_partner_path(path: Optional[Path], partner_suffix: str) -> Path:
@@ -225,12 +292,32 @@ class GeometryMatcher(ChamferMixin):
     voxel_size: float = 0.05
     samples_count: int = 5000
 
+    def __post_init__(self):
+        # Pairwise similarity results keyed by mesh ids and sampling parameters,
+        # valid only for the lifetime of the mesh objects (flushed via clear_cache)
+        self._similarity_cache = {}
+
     def calculate_similarity(self, mesh_a: NumpyMesh, mesh_b: NumpyMesh) -> float:
+        cache_key = (id(mesh_a), id(mesh_b), self.method, self.voxel_size, self.samples_count)
+        similarity = self._similarity_cache.get(cache_key, None)
+        if similarity is not None:
+            return similarity
         if self.method == 'VOXEL':
-            return self.calculate_similarity_voxel(mesh_a, mesh_b)
-        if self.method == 'POINT_CLOUD':
-            return self.calculate_similarity_point_cloud(mesh_a, mesh_b)
-        raise ValueError(f'Unknown geometry matching method {self.method}!')
+            similarity = self.calculate_similarity_voxel(mesh_a, mesh_b)
+        elif self.method == 'POINT_CLOUD':
+            similarity = self.calculate_similarity_point_cloud(mesh_a, mesh_b)
+        else:
+            raise ValueError(f'Unknown geometry matching method {self.method}!')
+        self._similarity_cache[cache_key] = similarity
+        return similarity
+
+    def clear_cache(self, meshes: Optional[Iterable[NumpyMesh]] = None):
+        """Flushes cached similarities and, optionally, per-mesh sampling caches."""
+        self._similarity_cache.clear()
+        if meshes is not None:
+            for mesh in meshes:
+                if mesh is not None:
+                    mesh._voxel_cache.clear()
     
     def calculate_similarity_point_cloud(self, mesh_a: NumpyMesh, mesh_b: NumpyMesh) -> float:
         """Calculates similarity between Mesh A and Mesh B.
@@ -253,6 +340,11 @@ class GeometryMatcher(ChamferMixin):
 
     def sample_points_on_mesh(self, mesh: NumpyMesh) -> numpy.ndarray:
         """Uniformly samples points on a mesh surface using triangle areas."""
+        cache_key = ('POINTS', self.samples_count)
+        cached_points = mesh._voxel_cache.get(cache_key, None)
+        if cached_points is not None:
+            return cached_points
+
         indices = mesh.get_data(Semantic.Index)
         positions = mesh.get_data(Semantic.Position)
 
@@ -276,12 +368,28 @@ class GeometryMatcher(ChamferMixin):
 
         sampled_points = a[:,None]*v0[tri_indices] + b[:,None]*v1[tri_indices] + c[:,None]*v2[tri_indices]
 
+        mesh._voxel_cache[cache_key] = sampled_points
+
         return sampled_points
 
-    def calculate_similarity_voxel(self, mesh_a, mesh_b):
+    def precompute_samples(self, mesh: NumpyMesh) -> numpy.ndarray:
+        """Returns the sampled representation of a mesh for current settings.
+
+        Sampling runs once per (method, parameters) combination and is cached on
+        the mesh, so every pairwise call against the same mesh reuses it.
+        """
+        if self.method == 'VOXEL':
+            return self.voxel_sample_mesh(mesh, voxel_size=self.voxel_size)
+        if self.method == 'POINT_CLOUD':
+            return self.sample_points_on_mesh(mesh)
+        raise ValueError(f'Unknown geometry matching method {self.method}!')
 
+    def calculate_similarity_voxel(self, mesh_a, mesh_b):
         points_a = self.voxel_sample_mesh(mesh_a, voxel_size=self.voxel_size)
         points_b = self.voxel_sample_mesh(mesh_b, voxel_size=self.voxel_size)
+        return self.calculate_similarity_voxel_precomputed(points_a, points_b)
+
+    def calculate_similarity_voxel_precomputed(self, points_a, points_b):
 
         if len(points_a) == 0 or len(points_b) == 0:
             return 0.0
@@ -309,10 +417,129 @@ class GeometryMatcher(ChamferMixin):
 
         return similarity * 100.0
 
+    def precompute_signature(self, mesh: NumpyMesh) -> numpy.ndarray:
+        """Returns a packed uint64 occupancy bitset over the mesh's voxel samples.
+
+        Voxel coordinates are hashed Bloom-filter-style into a fixed-size bitset,
+        so candidate ranking can use popcount Jaccard instead of float chamfer
+        math — similarity is only a ranking signal at the prefilter stage, and
+        the bitset touches a fraction of the memory bandwidth.
+        """
+        cache_key = ('SIGNATURE', self.voxel_size, self.samples_count)
+        signature = mesh._voxel_cache.get(cache_key, None)
+        if signature is not None:
+            return signature
+
+        points = self.voxel_sample_mesh(mesh, voxel_size=self.voxel_size)
+
+        words_count = max(16, -(-self.samples_count * 8 // 64))
+        bits_count = words_count * 64
+
+        vox = numpy.floor(points / self.voxel_size).astype(numpy.int64)
+        bit_indices = (vox[:, 0] * 73856093 ^ vox[:, 1] * 19349663 ^ vox[:, 2] * 83492791) % bits_count
+
+        signature = numpy.zeros(words_count, dtype=numpy.uint64)
+        numpy.bitwise_or.at(
+            signature,
+            bit_indices // 64,
+            numpy.uint64(1) << (bit_indices % 64).astype(numpy.uint64)
+        )
+
+        mesh._voxel_cache[cache_key] = signature
+
+        return signature
+
+    @staticmethod
+    def calculate_similarity_signature(signature_a: numpy.ndarray, signature_b: numpy.ndarray) -> float:
+        """Jaccard similarity between two occupancy bitsets, in percent."""
+        union = _popcount(signature_a | signature_b)
+        if union == 0:
+            return 0.0
+        return 100.0 * _popcount(signature_a & signature_b) / union
+
+    def calculate_similarities_voxel_batch(self, points_a: numpy.ndarray, points_b_list: List[numpy.ndarray], chunk_size=256, batch_points_limit=8192) -> numpy.ndarray:
+        """Scores points_a against many candidate point sets in one vectorized pass.
+
+        Candidates are concatenated into flat arrays so the distance math runs
+        as a few large NumPy operations instead of one small kernel per pair,
+        with per-candidate reductions done via reduceat over segment offsets.
+        The concatenation is capped at batch_points_limit points per group, so
+        transient distance matrices stay bounded no matter how many candidates
+        the prefilter throws at a single call. Returns an array of similarities
+        matching points_b_list order; empty candidates score 0.0, same as the
+        per-pair path.
+        """
+        counts = numpy.array([len(points_b) for points_b in points_b_list], dtype=numpy.int64)
+        similarities = numpy.zeros(len(points_b_list))
+
+        valid_indices = numpy.flatnonzero(counts)
+        if len(points_a) == 0 or len(valid_indices) == 0:
+            return similarities
+
+        # Group consecutive candidates up to the points budget; an oversized
+        # single candidate forms its own group, matching the per-pair bound
+        start = 0
+        while start < len(valid_indices):
+            end = start + 1
+            group_points = counts[valid_indices[start]]
+            while end < len(valid_indices) and group_points + counts[valid_indices[end]] <= batch_points_limit:
+                group_points += counts[valid_indices[end]]
+                end += 1
+            group = valid_indices[start:end]
+
+            flat_b = numpy.concatenate([points_b_list[index] for index in group])
+            group_counts = counts[group]
+            offsets = numpy.zeros(len(group_counts), dtype=numpy.int64)
+            numpy.cumsum(group_counts[:-1], out=offsets[1:])
+
+            similarities[group] = self._score_voxel_group(points_a, flat_b, offsets, group_counts, chunk_size)
+
+            start = end
+
+        return similarities
+
+    def _score_voxel_group(self, points_a: numpy.ndarray, flat_b: numpy.ndarray, offsets: numpy.ndarray, counts: numpy.ndarray, chunk_size: int) -> numpy.ndarray:
+        """Scores points_a against one concatenated group of candidate point sets."""
+        # Per-candidate min distance for each point of A, and min distance to A
+        # for each flat point of B, accumulated in chunks to save memory
+        min_ab = numpy.full((len(points_a), len(counts)), numpy.inf)
+        min_ba = numpy.full(len(flat_b), numpy.inf)
+        for start in range(0, len(points_a), chunk_size):
+            end = start + chunk_size
+            diff_chunk = points_a[start:end, None, :] - flat_b[None, :, :]
+            dist_chunk = numpy.linalg.norm(diff_chunk, axis=2)
+            min_ab[start:end] = numpy.minimum.reduceat(dist_chunk, offsets, axis=1)
+            min_ba = numpy.minimum(min_ba, dist_chunk.min(axis=0))
+
+        mean_ab = min_ab.mean(axis=0)
+        mean_ba = numpy.add.reduceat(min_ba, offsets) / counts
+
+        chamfer = 0.5 * (mean_ab + mean_ba)
+        asym = numpy.abs(mean_ab - mean_ba)
+
+        coverage_tol = float(self.voxel_size)
+        coverage = numpy.minimum(
+            (min_ab < coverage_tol).mean(axis=0),
+            numpy.add.reduceat(min_ba < coverage_tol, offsets) / counts
+        )
+
+        raw = chamfer + 0.5 * asym
+
+        similarity = numpy.maximum(0.0, 1.0 - raw / float(self.sensivity))
+
+        similarity *= (0.7 + 0.3 * coverage)
+
+        return similarity * 100.0
+
     def voxel_sample_mesh(self, mesh, voxel_size=0.05):
         """
         Deterministic voxel-grid sampling of mesh surface.
         """
+        cache_key = ('VOXEL', voxel_size)
+        cached_points = mesh._voxel_cache.get(cache_key, None)
+        if cached_points is not None:
+            return cached_points
+
         positions = mesh.get_data(Semantic.Position)
         indices = mesh.get_data(Semantic.Index)
 
@@ -333,8 +560,10 @@ class GeometryMatcher(ChamferMixin):
         # Voxelize
         vox = numpy.floor(tri_centers / voxel_size).astype(numpy.int32)
 
-        # Unique voxels
+        # Unique voxels; store samples as float32 to halve similarity bandwidth
         _, unique_idx = numpy.unique(vox, axis=0, return_index=True)
-        sampled_points = tri_centers[unique_idx]
+        sampled_points = tri_centers[unique_idx].astype(numpy.float32, copy=False)
+
+        mesh._voxel_cache[cache_key] = sampled_points
 
         return sampled_points